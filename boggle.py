@@ -7,9 +7,11 @@ This code is a work in progress.
 The code describes a Boggle-like computer game.
 """
 
-import os, time, threading, shutil, sys
-from typing import Optional, Sequence, Callable, Union
-from random import choice, choices, seed
+import os, threading, shutil, sys, marshal, textwrap, zlib
+from typing import Iterable, Optional, Sequence, Union
+from random import choices, seed
+from collections import Counter
+from contextlib import suppress
 
 
 class LetterFormatter:
@@ -42,6 +44,8 @@ class LetterFormatter:
         The string separating each row of letters.
     footer : str
         The footer string for the formatter.
+    row_format : str
+        The format string for a row of letters.
 
     """
     sep = '|||'
@@ -56,14 +60,15 @@ class LetterFormatter:
         self.row_sep = '\n|' + ('|' + '___' + '||') * self.letters_per_row + \
             '\n'
         self.footer = '|' + ('/' + '___' + '\\|') * self.letters_per_row
+        self.row_format = self.wrap + self.sep.join(
+            [f'{{:<{self.letter_width}}}'] * self.letters_per_row
+        ) + self.wrap
 
     def format(self, letters: Sequence[str]) -> str:
-        rows = map(
-            lambda row: self.wrap + \
-                self.sep.join([f'{r:<{self.letter_width}}' for r in row]) + \
-                self.wrap,
-            zip(*[iter(letters)] * self.letters_per_row)
-        )
+        n = self.letters_per_row
+        # With no letters per row there are no rows, e.g. for an empty board
+        rows = [self.row_format.format(*letters[i:i+n])
+                for i in range(0, len(letters) - n + 1, n)] if n > 0 else []
         s = self.header + self.row_sep.join(rows) + self.row_sep + \
             self.footer
         return s
@@ -98,19 +103,37 @@ class Board:
         Probability of a letter on the board being a vowel.
     p_con : float
         Probability of a letter on the board being a consonant.
-    letters : list of str
-        List of letters on the board.
-    adjacency : dict of list of int
-        Adjacency matrix for each index on the board.
-    found_words : Set of str
+    letters : tuple of str
+        Tuple of letters on the board.
+    letter_ids : bytes
+        Integer code of each letter on the board, see letter_codes.
+    adjacency : tuple of tuple of int
+        Adjacent indices for each index on the board.
+    adj_mask : tuple of int
+        Adjacency bitmask for each index on the board, where bit j is set if
+        index j is adjacent.
+    found_words : frozenset of str
         Set of all possible words on the board. Empty unless find_words is
         called.
 
     """
+    __slots__ = ('size', 'p_vow', 'p_con', 'letters', 'letter_ids', '_str',
+                 'adjacency', 'adj_mask', 'found_words')
 
     _vowels = list('AEIOU')
     _consonants = list('BCDFGHJKLMNPQRSTVWXYZ')
     _consonants[_consonants.index('Q')] += 'U'
+    # Integer codes of the letters on tiles, indexing the nodes of a trie
+    # from Boggle.load_words. Letters on one tile, such as 'QU', share a
+    # code. Set by _set_letter_codes, see below the class
+    _letter_codes = {}
+    # Index of a trie node which is True if a word ends at the node
+    _word_end = 0
+    _adjacency_cache = {}  # Adjacency for each board size
+    # Row and column offsets of the neighbours of an element: above,
+    # northwest, northeast, below, southwest, southeast, left and right
+    _neighbours = ((-1, 0), (-1, -1), (-1, 1), (1, 0), (1, -1), (1, 1),
+                   (0, -1), (0, 1))
 
     def __init__(self, size: Optional[int]=4, 
                  letters: Optional[Sequence[str]]=None, 
@@ -122,6 +145,9 @@ class Board:
         self.p_vow = p_vow or 0.38
         self.p_con = p_con or 0.62
         self.letters = self._validate_letters(letters)
+        self.letter_ids = bytes(
+            self._letter_codes[letter] for letter in self.letters
+        )
         
         if letters is not None:
             size = len(self.letters)**0.5
@@ -132,8 +158,8 @@ class Board:
         formatter = LetterFormatter(letters_per_row=self.size)
         self._str = formatter.format(self.letters)
 
-        self.adjacency = self._init_adjacency()
-        self.found_words = set()
+        self.adjacency, self.adj_mask = self._build_adjacency(self.size)
+        self.found_words = frozenset()
     
     @classmethod
     def vowels(cls):
@@ -143,13 +169,35 @@ class Board:
     def consonants(cls):
         return cls._consonants
 
+    @classmethod
+    def letter_codes(cls):
+        return cls._letter_codes
+
+    @classmethod
+    def word_end(cls):
+        return cls._word_end
+
     @classmethod
     def set_vowels(cls, vowels: Sequence[str]):
         cls._vowels = vowels
+        cls._set_letter_codes()
 
     @classmethod
     def set_consonants(cls, consonants: Sequence[str]):
         cls._consonants = consonants
+        cls._set_letter_codes()
+
+    @classmethod
+    def _set_letter_codes(cls):
+        """
+        Assign an integer code to each letter tile, once the vowels or
+        consonants change.
+        """
+        letters = sorted({letter.upper() for letter in
+                          [*cls._vowels, *cls._consonants]})
+        cls._letter_codes = {letter: code for (code, letter)
+                             in enumerate(letters)}
+        cls._word_end = len(cls._letter_codes)
 
     def __str__(self):
         return self._str
@@ -189,8 +237,8 @@ class Board:
 
         Returns
         -------
-        letters : list of str
-            List of letters on the board.
+        letters : tuple of str
+            Tuple of interned letters on the board.
 
         Raises
         ------
@@ -201,55 +249,44 @@ class Board:
         if isinstance(letters, Sequence):
             letters = [self._validate_letter(letter) for letter in letters]
         elif letters is None:
-            letter_choices = self.choose_letters(k=self.size**2)
-            letters = [c() for c in letter_choices]
+            letters = [letter.upper() for letter in
+                       self.choose_letters(k=self.size**2)]
         else:
             raise TypeError('Variable letters is not a Sequence or None.')
-        return letters
+        return tuple(sys.intern(letter) for letter in letters)
 
-    def _init_adjacency(self):
+    @classmethod
+    def _build_adjacency(cls, size: int) -> tuple:
         """
-        Initialise the adjacency matrix for the board.
+        Build the adjacency matrix for a board of a given size. This is
+        cached for each size, since it only depends on size.
 
         Returns
         -------
-        adjacency : dict of list of int
-            The adjacency for each index of the board.
-
-        """
-        adjacency = {}
-        for i in range(self.size**2):
-            x, y = divmod(i, self.size)
-            adjacency[i] = adj = []
-            if x > 0: 
-                # If row is not first, add above element index
-                adj.append(i - self.size)
-                if y > 0:
-                    # If column is not first, add northwest element index
-                    adj.append(i - self.size - 1)
-                if y < self.size - 1:
-                    # If column is not last, add northeast element index
-                    adj.append(i - self.size + 1)
-            if x < self.size - 1:
-                # If row is not last, add below element index
-                adj.append(i + self.size)
-                if y > 0:
-                    # If column is not first, add southwest element index
-                    adj.append(i + self.size - 1)
-                if y < self.size - 1:
-                    # If column is not last, add southeast element index
-                    adj.append(i + self.size + 1)
-            if y > 0:
-                # If column is not first, add left element index
-                adj.append(i - 1)
-            if y < self.size - 1:
-                # If column is not last, add right element index
-                adj.append(i + 1)
-        return adjacency
-
-    def choose_letters(self, k=1):
-        """
-        Choose vowel or consonant letter types.
+        adjacency : tuple of tuple of int
+            The adjacent indices for each index of the board.
+        adj_mask : tuple of int
+            The adjacency bitmask for each index of the board.
+
+        """
+        if size in cls._adjacency_cache:
+            return cls._adjacency_cache[size]
+        adjacency = []
+        for i in range(size**2):
+            x, y = divmod(i, size)
+            # Add the index of each neighbouring element which is on the board
+            adjacency.append(tuple(
+                (x + dx)*size + y + dy for (dx, dy) in cls._neighbours
+                if 0 <= x + dx < size and 0 <= y + dy < size
+            ))
+        adj_mask = tuple(sum(1 << j for j in adj) for adj in adjacency)
+        cls._adjacency_cache[size] = (tuple(adjacency), adj_mask)
+        return cls._adjacency_cache[size]
+
+    def choose_letters(self, k: int=1) -> list:
+        """
+        Choose random letters, each a vowel or consonant according to p_vow
+        and p_con.
 
         Properties
         ----------
@@ -258,53 +295,80 @@ class Board:
 
         Returns
         -------
-        choices : list of Callable
-            List of functions which choose from vowels or consonants when
-            called.
+        choices : list of str
+            List of chosen letters.
         """
-        return choices([lambda: choice(self._vowels), 
-                        lambda: choice(self._consonants)], 
-                       weights=[self.p_vow, self.p_con], k=k)
-
-    def find_words(self, words: Sequence[str]):
+        # Split the probability of each letter type evenly between its
+        # letters, so that all letters are drawn in a single call
+        alphabet = self._vowels + self._consonants
+        weights = [self.p_vow/len(self._vowels)] * len(self._vowels) + \
+            [self.p_con/len(self._consonants)] * len(self._consonants)
+        return choices(alphabet, weights=weights, k=k)
+
+    def find_words(self, trie: list, verbose: bool=False) -> None:
         """
         Finds all possible words on the board and sets found_words.
 
         Parameters
         ----------
-        words : Sequence of str
-            The sequence of valid words.
+        trie : list
+            The trie of valid words, as returned by Boggle.load_words.
+        verbose : bool
+            Whether to report progress of the search. Default is False.
         
         """
-        prefixes = {w[:i] for w in words for i in range(1, len(w))}
-        
         found = set()
-
-        def _advance_path(prefix, path):
-            """
-            Advance the path of possible words given the prior prefix and path
-            indices.
-            """
-            if prefix in words:
-                # If prefix is in list of words, add to found words
-                found.add(prefix)
-            if prefix in prefixes:
-                # If prefix is in the list of prefixes, advance the path
-                for j in self.adjacency[path[-1]]:
-                    # For each adjacent letter to the last element in the path
-                    if j not in path:
-                        # If element is not already in the path, advance path
-                        _advance_path(prefix + self.letters[j], path + [j])
-
-        for (i, letter) in enumerate(self.letters):
+        # Bind attributes used in the search loop to local names
+        letters = self.letters
+        letter_ids = self.letter_ids
+        adj_mask = self.adj_mask
+        word_end = self._word_end
+        add_found = found.add
+        # Letters along the current path, indexed by depth. The search is
+        # depth-first, so entries below the depth of a popped node always
+        # hold its ancestors
+        path = [None] * self.size**2
+
+        for (i, letter_id) in enumerate(letter_ids):
             # For each letter in the list of board letters, start a path
-            sys.stdout.write('\r')
-            sys.stdout.write(
-                'Finding words on board {:2.0f}%'.format(100*i/self.size**2)
-            ) 
-            sys.stdout.flush()
-            _advance_path(letter, [i])
-        self.found_words = found
+            if verbose and i % self.size == 0:
+                # Report progress once per row of the board
+                sys.stdout.write(
+                    '\rFinding words on board {:2.0f}%'.format(
+                        100*i/self.size**2
+                    )
+                )
+                sys.stdout.flush()
+            node = trie[letter_id]
+            if node is None:
+                continue
+            # Stack of (trie node, last index in path, bitmask of path indices,
+            # depth of path)
+            stack = [(node, i, 1 << i, 0)]
+            push, pop = stack.append, stack.pop
+            while stack:
+                node, last, visited, depth = pop()
+                path[depth] = letters[last]
+                if node[word_end]:
+                    # If node ends a word, add to found words
+                    add_found(''.join(path[:depth+1]))
+                depth += 1
+                # Bitmask of adjacent elements to the last element in the
+                # path which are not already in the path
+                available = adj_mask[last] & ~visited
+                while available:
+                    # Take the lowest set bit, i.e. adjacent element j
+                    bit = available & -available
+                    available ^= bit
+                    j = bit.bit_length() - 1
+                    # If element continues a word in the trie, advance path
+                    child = node[letter_ids[j]]
+                    if child is not None:
+                        push((child, j, visited | bit, depth))
+        self.found_words = frozenset(found)
+
+
+Board._set_letter_codes()
 
 
 class Player:
@@ -332,6 +396,7 @@ class Player:
         Message to display to the player at the beginning of their turn.
 
     """
+    __slots__ = ('name', 'score', 'found_words', 'message')
 
     def __init__(self, name: str='Player', score: int=0,
                  found_words: Optional[Sequence[str]]=None):
@@ -344,12 +409,12 @@ class Player:
         """
         Scores a word given a guess and set of available words.
         """
-        if guess in available_words and guess not in self.found_words:
-            self.score += Boggle.find_score(guess)
-            self.found_words.add(guess)
-        elif guess in self.found_words:
+        if guess in self.found_words:
             self.message = 'You have already entered this word, ' + \
                 'please try again!'
+        elif guess in available_words:
+            self.score += Boggle.find_score(guess)
+            self.found_words.add(guess)
         elif guess is not None:
             self.message = 'Invalid word, try again!'
 
@@ -366,22 +431,24 @@ class Boggle:
     Class for the Boggle game. Controls the operation of the game.
 
     """
+    __slots__ = ('_width', '_div', 'player', 'board', 'timer', '_found_cache',
+                 'trie', 'in_play')
+
     _points: dict = {3: 1, 4: 2, 5: 4, 6: 6, 7: 9, 8: 15}
+    _cache_version: int = 4  # Increment when the format of the trie changes
+    _board_cache: dict = {}  # Words found on boards, see __init__
+    _board_cache_size: int = 16  # Most boards kept in _board_cache
+    _trie_cache: dict = {}  # Tries loaded, see load_words
     _indent: int = 24
-    _wordrows: dict = {}  
+    _wordrows: dict = {}  # Labels for rows of words, see _build_wordrows
     _formatter: LetterFormatter = LetterFormatter()
     _title: str = _formatter.format('Boggle')
 
     def __init__(self, player: Optional[Player]=None,
                  board: Optional[Board]=None, time_limit: int=120,
                  words_file: str='words.txt'):
-        
-        k_max = max(self._points.keys())
-        for k, v in self._points.items():
-            plural = 's' if v > 1 else ''
-            plus = '+' if k == k_max else ''
-            self._wordrows[k] = f'{f"{k}{plus} letters ({v} point{plural})":<{self._indent-2}}: '
-            # del plural       
+
+        self._build_wordrows()
         self._width = max(shutil.get_terminal_size()[0], 80)
         self._div = self._width * '='
 
@@ -389,9 +456,37 @@ class Boggle:
         self.board = board or Board()
         self.timer = threading.Timer(time_limit, self.stop)
         self.timer.daemon = True  # Timer thread closes with main thread
+        # Words found by the player and their formatted block, so the block
+        # is only reformatted when the words change
+        self._found_cache = (frozenset(), '')
         
-        words = self.load_words(words_file)
-        self.board.find_words(words)
+        self.trie = self.load_words(words_file)
+        # Reuse the words found on an identical board with the same trie.
+        # The trie is kept with the words found, so its id cannot be reused
+        # by a later trie while the entry exists
+        key = (self.board.letters, id(self.trie))
+        if key in self._board_cache:
+            self.board.found_words = self._board_cache[key][1]
+        else:
+            self.board.find_words(self.trie, verbose=True)
+            if len(self._board_cache) >= self._board_cache_size:
+                # Forget the board cached first
+                del self._board_cache[next(iter(self._board_cache))]
+            self._board_cache[key] = (self.trie, self.board.found_words)
+
+    @classmethod
+    def _build_wordrows(cls):
+        """
+        Build the labels for each row of words. These only depend on the
+        points and indent, so are built once and shared between games.
+        """
+        if cls._wordrows:
+            return
+        k_max = max(cls._points.keys())
+        for k, v in cls._points.items():
+            plural = 's' if v > 1 else ''
+            plus = '+' if k == k_max else ''
+            cls._wordrows[k] = f'{f"{k}{plus} letters ({v} point{plural})":<{cls._indent-2}}: '
 
     @classmethod
     def points(cls):
@@ -404,78 +499,257 @@ class Boggle:
     @classmethod
     def set_points(cls, points: dict):
         cls._points = points
+        cls._wordrows = {}  # Rebuilt for the new points
+        cls._build_wordrows()
 
     @classmethod
     def set_indent(cls, indent: int):
         cls._indent = indent
+        cls._wordrows = {}  # Rebuilt for the new indent
+        cls._build_wordrows()
     
     @classmethod
-    def find_score(cls, words: Union[str, Sequence[str]]):
+    def find_score(cls, words: Union[str, Sequence[str]]) -> int:
         """
         Calculate score for given word(s).
         """
-        if isinstance(words, str):  # If words is just a string, make iterable
-            words = {words}
-        score = 0
         k_max = max(cls._points.keys())
-        for w in words:
-            score += cls._points[min(len(w), k_max)]
-        return score
+        if isinstance(words, str):
+            return cls._points[min(len(words), k_max)]
+        # Count the words of each length, then score each length once
+        counts = Counter(map(len, words))
+        return sum(cls._points[min(k, k_max)] * n for (k, n) in counts.items())
 
-    @staticmethod
-    def load_words(file, min_len: int=3):
+    @classmethod
+    def load_words(cls, file, min_len: int=3) -> list:
         """
-        Loads a list of words from a given file.
+        Loads words from a given file and builds a trie of them.
+
+        If file is a path, the trie is cached in a file next to it with a
+        '.min<min_len>.cache' suffix, and reloaded from there while the file
+        is unchanged.
+
+        Returns
+        -------
+        trie : list
+            Trie of words. Each node is a list, indexed by the code of a
+            board letter (see Board.letter_codes) to give its child node or
+            None, and by Board.word_end to give True if a word ends at the
+            node. The letters of one tile, such as 'QU', share a single
+            node, as they do on the board. Identical subtrees are shared,
+            see build_trie.
+
         """
         def load(f):
-            for line in f:
-                # Strip off whitespace at end of line and capitalize
-                word = line.rstrip().upper()
-                if len(word) >= min_len:
-                    # If word length is at least the minimum,
-                    # yield word in iteration
-                    yield word
-
-        if isinstance(file, str):
-            with open(file) as f:
-                words = set(load(f))
-        else:
-            words = set(load(file))
-        # Finds set of prefixes for each word
-        return words
+            # Capitalize and split the whole file at once, rather than line
+            # by line
+            data = f.read()
+            if isinstance(data, bytes):
+                data = data.decode()
+            return [word for word in data.upper().split()
+                    if len(word) >= min_len]
+
+        if not isinstance(file, str):
+            return cls.build_trie(load(file))
+
+        # Modification time and size identify the version of the file
+        # cached, and the letters its trie is indexed by
+        stat = os.stat(file)
+        fingerprint = (cls._cache_version, stat.st_mtime, stat.st_size,
+                       tuple(Board.letter_codes()))
+        cache = f'{file}.min{min_len}.cache'
+        # Building the trie takes several times longer than loading it, so
+        # it is kept in memory for later games and on disk for later runs
+        if cls._trie_cache.get(cache, (None,))[0] == fingerprint:
+            # Already loaded by this process
+            return cls._trie_cache[cache][1]
+        # The cache is marshalled, as unlike pickle marshal cannot run code
+        # when loading, which matters as the default words file, and so its
+        # cache, is relative to the working directory
+        try:
+            with open(cache, 'rb') as f:
+                cached_fingerprint, checksum, data = marshal.load(f)
+            if cached_fingerprint == fingerprint and \
+                    zlib.crc32(data) == checksum:
+                trie = marshal.loads(data)
+                cls._trie_cache[cache] = (fingerprint, trie)
+                return trie
+        except Exception:
+            # Caching is optional, so a cache which is damaged or cannot be
+            # read falls back to rebuilding the trie
+            pass
+
+        with open(file, 'rb') as f:
+            trie = cls.build_trie(load(f))
+        # Write to a temporary file first, so that an interrupted write
+        # cannot leave a partial cache behind
+        temp = f'{cache}.{os.getpid()}.tmp'
+        try:
+            with open(temp, 'wb') as f:
+                # Only marshal the trie once the file is open, as that fails
+                # early if the directory is read-only
+                data = marshal.dumps(trie)
+                marshal.dump((fingerprint, zlib.crc32(data), data), f)
+            os.replace(temp, cache)
+        except (OSError, ValueError):
+            # Caching is optional, e.g. if the directory is read-only or the
+            # trie is too deeply nested to marshal
+            with suppress(OSError):
+                os.remove(temp)
+        cls._trie_cache[cache] = (fingerprint, trie)
+        return trie
+
+    @staticmethod
+    def build_trie(words: Iterable[str]) -> list:
+        """
+        Builds a minimized trie from an Iterable of words. See load_words.
+
+        The trie is built as a directed acyclic word graph (DAWG), in which
+        identical subtrees, e.g. the common endings of words, are shared.
+        The words are added in sorted order, so that once a word has been
+        added the nodes below its prefix shared with the next word are
+        complete, and are merged with any identical node found before.
+
+        Examples
+        --------
+        A word is added for every way it can be split into tiles, so with a
+        'TH' tile 'THE' is still found on a board of single letters,
+
+        >>> Board.set_consonants(Board.consonants() + ['TH'])
+        >>> board = Board(letters=['T', 'H', 'E', 'X'])
+        >>> board.find_words(Boggle.build_trie(['THE', 'HEX']))
+        >>> sorted(board.found_words)
+        ['HEX', 'THE']
+        >>> Board.set_consonants(Board.consonants()[:-1])
+
+        """
+        codes = Board.letter_codes()
+        word_end = Board.word_end()
+        # Translate words to one character per tile, whose ordinal is its
+        # letter code. Words are joined to translate them all at once. Every
+        # other character, including the separator, is given an ordinal of
+        # its own above the letter codes, so that it cannot be confused with
+        # a tile and words which contain one are skipped
+        text = ' '.join(words)
+        others = {' ', *text, *''.join(codes)}.difference(codes)
+        table = {ord(letter): code for (letter, code) in codes.items()
+                 if len(letter) == 1}
+        table.update((ord(char), word_end + i)
+                     for (i, char) in enumerate(sorted(others)))
+        separator = chr(table[ord(' ')])
+        words = text.translate(table).split(separator)
+        # Tiles of several letters, such as 'QU', by their translated letters
+        tiles = {letter.translate(table): chr(code)
+                 for (letter, code) in codes.items() if len(letter) > 1}
+        if tiles:
+            # Add each way to spell the words which contain one of the tiles.
+            # Spellings left with any letter which is not a tile, such as
+            # 'Q', are skipped below with the rest
+            found = {word for letters in tiles for word in words
+                     if letters in word}
+            words.extend(spelling for word in found
+                         for spelling in Boggle._spellings(word, tiles))
+        limit = chr(word_end)
+        words = sorted(word for word in words if word and max(word) < limit)
+
+        width = word_end + 1
+        # Nodes which are complete, by index. Index 0 stands for the flag
+        # that a word ends at a node
+        nodes = [True]
+        # Index of each complete node by its edges, so it is only made once
+        register = {}
+        # Edges (letter code, index of child) of each incomplete node along
+        # the path of the last word added, starting from the root
+        path = [[]]
+        end = (word_end, 0)
+        last = ''
+        for word in words + ['']:
+            # Length of the prefix shared with the last word
+            i = 0
+            for (a, b) in zip(word, last):
+                if a != b:
+                    break
+                i += 1
+            # Complete the nodes of the last word below the shared prefix,
+            # from the deepest up, and add each as an edge of its parent
+            for char in reversed(last[i:]):
+                edges = tuple(path.pop())
+                index = register.get(edges)
+                if index is None:
+                    node = [None] * width
+                    for (code, child) in edges:
+                        node[code] = nodes[child]
+                    index = register[edges] = len(nodes)
+                    nodes.append(node)
+                path[-1].append((ord(char), index))
+            # Add the nodes for the rest of the word, the last one ending it
+            if i < len(word):
+                for _ in range(len(word) - i - 1):
+                    path.append([])
+                path.append([end])
+            last = word
+
+        # The words are done, so the root is the only node left
+        trie = [None] * width
+        for (code, child) in path[0]:
+            trie[code] = nodes[child]
+        return trie
+
+    @staticmethod
+    def _spellings(word: str, tiles: dict) -> list:
+        """
+        Finds every way to spell a word with its single letters and tiles of
+        several letters, where tiles maps the letters of each such tile to
+        the character that replaces them.
+
+        Examples
+        --------
+        >>> sorted(Boggle._spellings('THE', {'TH': '1', 'HE': '2'}))
+        ['1E', 'T2', 'THE']
+
+        """
+        # Spellings of each ending of the word, starting from the empty one
+        endings = {len(word): ['']}
+        for i in range(len(word) - 1, -1, -1):
+            endings[i] = [word[i] + rest for rest in endings[i+1]]
+            for (letters, tile) in tiles.items():
+                if word.startswith(letters, i):
+                    endings[i] += [tile + rest
+                                   for rest in endings[i+len(letters)]]
+        return endings[0]
 
     @staticmethod
     def clear_screen():
         """
         Clear the screen.
         """
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            # ANSI escape codes to clear the screen and move the cursor home,
+            # avoiding a subprocess per redraw
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
 
     def format_words(self, words: Sequence[str], separator: str=', '):
         """
         Formats a list of words neatly.
         """
-        available = self._width - self._indent
         rows = {k: [] for k in self._points.keys()}
-        sorted(words)  # sort alphabetically
         k_max = max(self._points.keys())
-        for word in words:
+        for word in sorted(words):  # sort alphabetically
             rows[min(len(word), k_max)].append(word)
 
         blocks = []
         for key, value in rows.items():
             if len(value) == 0:
                 continue
-            s = f'{self._wordrows[key]:<{self._indent}}'
-
-            words_per_line = available//(key+len(separator))
-            total_lines = len(value)//words_per_line + 1
-
-            indices = [i*words_per_line for i in range(total_lines)]
-            lines = [separator.join(value[i:j]) for i, j in \
-                zip(indices, indices[1:]+[None])]
-            
-            s += (separator+'\n'+' '*self._indent).join(lines)
+            s = textwrap.fill(
+                separator.join(value), width=self._width,
+                initial_indent=self._wordrows[key],
+                subsequent_indent=' '*self._indent, break_long_words=False,
+                break_on_hyphens=False
+            )
             blocks.append(s)
         return '\n'.join(blocks)
 
@@ -483,41 +757,62 @@ class Boggle:
         """
         Displays the board on a blank screen.
         """
-        self.clear_screen()
-        print(self._title)
-        print('Score: {0}'.format(self.player.score))
-        print(self._div)
-        print(self.board)
-        print(self._div)
-        print('Words found:')
-        print(self.format_words(self.player.found_words))
-        print(self._div)
+        found_words = self.player.found_words
+        if found_words != self._found_cache[0]:
+            # Compared by value, so the block also follows a reset or a
+            # change of player
+            self._found_cache = (
+                frozenset(found_words), self.format_words(found_words)
+            )
+        lines = [
+            self._title,
+            'Score: {0}'.format(self.player.score),
+            self._div,
+            str(self.board),
+            self._div,
+            'Words found:',
+            self._found_cache[1],
+            self._div,
+        ]
         if self.player.message:
-            print(self.player.message)
-            print(self._div)
+            lines += [self.player.message, self._div]
             self.player.message = None
+        self.clear_screen()
+        self.write_lines(lines)
 
     def endgame(self):
         """
         Displays the endgame screen and information.
         """
-        self.clear_screen()
-        print(self._title)
         total_score = self.find_score(self.board.found_words)
         final_score = 100 * self.player.score/total_score
-        print((
-            'Your final score was {0:.0f}%!\n' +
-            'You scored {1} out of {2} possible points on this board.'
-            ).format(final_score, self.player.score, total_score))
-        print(self._div)
-        print('You found the following words:')
-        print(self.format_words(self.player.found_words))
-        print(self._div)
-        print('You missed the following words:')
         missed_words = self.board.found_words.difference(
             self.player.found_words
         )
-        print(self.format_words(missed_words))
+        lines = [
+            self._title,
+            (
+                'Your final score was {0:.0f}%!\n' +
+                'You scored {1} out of {2} possible points on this board.'
+            ).format(final_score, self.player.score, total_score),
+            self._div,
+            'You found the following words:',
+            self.format_words(self.player.found_words),
+            self._div,
+            'You missed the following words:',
+            self.format_words(missed_words),
+        ]
+        self.clear_screen()
+        self.write_lines(lines)
+
+    @staticmethod
+    def write_lines(lines: Sequence[str]):
+        """
+        Writes lines to the screen in a single write, rather than a print for
+        each line.
+        """
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
 
     def start(self):
         """